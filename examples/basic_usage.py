@@ -39,13 +39,12 @@ async def main():
     )
 
     # Create runner
-    runner = AgentRunner(settings)
-
-    # Run a simple task
-    result = await runner.run_once(
-        prompt="What are the top 3 best practices for Python error handling? Be brief.",
-        task_description="Python best practices query",
-    )
+    async with AgentRunner(settings) as runner:
+        # Run a simple task
+        result = await runner.run_once(
+            prompt="What are the top 3 best practices for Python error handling? Be brief.",
+            task_description="Python best practices query",
+        )
 
     # Check results
     print(f"\n{'='*50}")
@@ -43,23 +43,21 @@ async def main():
         ),
     )
 
-    # Create runner
-    runner = AgentRunner(settings)
-
     print("Starting service mode...")
     print("Press Ctrl+C to stop")
     print(f"Interval: {settings.service_interval_seconds}s")
     print("-" * 50)
 
-    # Run as service
-    await runner.run_service(
-        prompt="""Quick system check:
+    # Create runner and run as service; connections are reused across runs
+    async with AgentRunner(settings) as runner:
+        await runner.run_service(
+            prompt="""Quick system check:
 1. What time is it?
 2. Confirm you're operational
 
 Keep response under 50 words.""",
-        task_description="Periodic health check",
-    )
+            task_description="Periodic health check",
+        )
 
     print("\nService stopped.")
 
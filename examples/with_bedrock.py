@@ -50,13 +50,12 @@ async def main():
     )
 
     # Create runner
-    runner = AgentRunner(settings)
-
-    # Run a task via Bedrock
-    result = await runner.run_once(
-        prompt="What are the key benefits of using AWS Bedrock for Claude?",
-        task_description="Bedrock info query",
-    )
+    async with AgentRunner(settings) as runner:
+        # Run a task via Bedrock
+        result = await runner.run_once(
+            prompt="What are the key benefits of using AWS Bedrock for Claude?",
+            task_description="Bedrock info query",
+        )
 
     print(f"Status: {result.status.value}")
     print(f"Using Bedrock: {settings.bedrock.enabled}")
@@ -52,14 +52,13 @@ async def main():
         ),
     )
 
-    # Create runner
-    runner = AgentRunner(settings)
-
-    # Run a task - result will be posted to Slack
-    result = await runner.run_once(
-        prompt="Generate a brief status report: What time is it and what's 2+2?",
-        task_description="Test notification",
-    )
+    # Create runner (closes its Slack connection pool on exit)
+    async with AgentRunner(settings) as runner:
+        # Run a task - result will be posted to Slack
+        result = await runner.run_once(
+            prompt="Generate a brief status report: What time is it and what's 2+2?",
+            task_description="Test notification",
+        )
 
     print(f"Status: {result.status.value}")
     print(f"Slack notification sent: {settings.slack.enabled}")
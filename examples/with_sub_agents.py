@@ -6,6 +6,7 @@ This example demonstrates:
 - Defining multiple sub-agents
 - Using specialized agents for different tasks
 - Sub-agent tool restrictions
+- Running independent sub-agents in parallel
 """
 
 import asyncio
@@ -69,20 +70,22 @@ Provide specific recommendations.""",
         ),
     )
 
-    # Create runner
-    runner = AgentRunner(settings)
+    prompt = """Analyze the Python code in this project:
 
-    # Run analysis task
-    result = await runner.run_once(
-        prompt="""Analyze the Python code in this project:
+1. Run the code-reviewer (quality issues) and the test-analyzer (test
+   coverage) in parallel - launch both in a single message, since neither
+   depends on the other's findings
+2. Once both have reported, summarize findings and provide top recommendations
 
-1. First, use the code-reviewer to check for quality issues
-2. Then, use the test-analyzer to evaluate test coverage
-3. Summarize findings and provide top recommendations
+Focus on the most impactful improvements."""
 
-Focus on the most impactful improvements.""",
-        task_description="Code quality analysis",
-    )
+    # Create runner
+    async with AgentRunner(settings) as runner:
+        # Run analysis task
+        result = await runner.run_once(
+            prompt=prompt,
+            task_description="Code quality analysis",
+        )
 
     print(f"\nAnalysis Complete!")
     print(f"Status: {result.status.value}")
@@ -5,12 +5,28 @@ This framework provides a comprehensive solution for running Claude agents
 in various deployment scenarios including cron jobs, services, and interactive modes.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from claude_agent_framework._lazy import attach
+
 __version__ = "0.1.0"
 __author__ = "Agent Framework"
 
-from claude_agent_framework.config.settings import AgentConfig, Settings
-from claude_agent_framework.core.engine import AgentEngine
-from claude_agent_framework.core.runner import AgentRunner
+if TYPE_CHECKING:
+    from claude_agent_framework.config.settings import AgentConfig, Settings
+    from claude_agent_framework.core.engine import AgentEngine
+    from claude_agent_framework.core.runner import AgentRunner
+
+# Public names are imported on first access (PEP 562) so that light entry
+# points such as ``caf version`` don't pay for the SDK and pydantic imports.
+_LAZY_IMPORTS = {
+    "AgentEngine": "claude_agent_framework.core.engine",
+    "AgentRunner": "claude_agent_framework.core.runner",
+    "Settings": "claude_agent_framework.config.settings",
+    "AgentConfig": "claude_agent_framework.config.settings",
+}
 
 __all__ = [
     "AgentEngine",
@@ -18,3 +34,6 @@ __all__ = [
     "Settings",
     "AgentConfig",
 ]
+
+
+__getattr__, __dir__ = attach(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,37 @@
+"""Lazy re-exports for package ``__init__`` modules (PEP 562)."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def attach(
+    package: str,
+    lazy_imports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazy re-exports.
+
+    Args:
+        package: ``__name__`` of the module doing the re-exporting
+        lazy_imports: Exported name -> module that defines it
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions to bind in the module
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_imports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(lazy_imports[name]), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(lazy_imports))
+
+    return __getattr__, __dir__
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from claude_agent_framework.config.settings import ModelType, SubAgentConfig
 
 # Code Review Agent
@@ -97,20 +99,24 @@ Provide specific remediation steps.""",
 )
 
 
-# Template registry
-AGENT_TEMPLATES = {
+# Template registry (read-only; templates are validated once at import)
+AGENT_TEMPLATES = MappingProxyType({
     "code-reviewer": CODE_REVIEWER_AGENT,
     "data-analyst": DATA_ANALYST_AGENT,
     "log-analyzer": LOG_ANALYZER_AGENT,
     "security-auditor": SECURITY_AUDITOR_AGENT,
-}
+})
 
 
 def get_agent_template(name: str) -> SubAgentConfig | None:
-    """Get a pre-built agent template by name."""
+    """Get a pre-built agent template by name.
+
+    The returned config is shared across callers and must not be mutated;
+    use ``template.model_copy(update={...})`` to derive a customized agent.
+    """
     return AGENT_TEMPLATES.get(name)
 
 
 def list_agent_templates() -> list[str]:
     """List available agent template names."""
-    return list(AGENT_TEMPLATES.keys())
+    return list(AGENT_TEMPLATES)
@@ -9,16 +9,14 @@ Provides commands for:
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from claude_agent_framework.config.settings import Settings, load_settings
-from claude_agent_framework.core.runner import AgentRunner
+if TYPE_CHECKING:
+    from claude_agent_framework.config.settings import Settings
 
 app = typer.Typer(
     name="caf",
@@ -29,14 +27,53 @@ app = typer.Typer(
 console = Console()
 
 
+def _version_callback(value: bool) -> None:
+    """Print the version and exit before any command is resolved."""
+    if value:
+        from claude_agent_framework import __version__
+
+        typer.echo(f"Claude Agent Framework v{__version__}")
+        raise typer.Exit()
+
+
+@app.callback()
+def main(
+    version: bool = typer.Option(
+        False,
+        "--version",
+        "-V",
+        help="Show version and exit",
+        callback=_version_callback,
+        is_eager=True,
+    ),
+) -> None:
+    """Claude Agent Framework - Run Claude agents for automation tasks"""
+
+
 def load_config(
     env_file: Path | None = None,
     config_file: Path | None = None,
 ) -> Settings:
     """Load configuration from files."""
+    from claude_agent_framework.config.settings import load_settings
+
     return load_settings(env_file=env_file, config_file=config_file)
 
 
+def resolve_prompt(
+    prompt: str | None,
+    prompt_file: Path | None,
+    settings: Settings,
+) -> str | None:
+    """Resolve the task prompt: --prompt-file, then argument, then settings."""
+    if prompt_file:
+        try:
+            return prompt_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+    return prompt or settings.get_task_prompt()
+
+
 @app.command()
 def run(
     prompt: str | None = typer.Argument(
@@ -114,7 +151,12 @@ def run(
     # Apply CLI overrides
     if model:
         from claude_agent_framework.config.settings import ModelType
-        settings.agent.model = ModelType(model)
+        try:
+            settings.agent.model = ModelType(model)
+        except ValueError:
+            choices = ", ".join(m.value for m in ModelType)
+            console.print(f"[red]Error: Unknown model '{model}'. Choose from: {choices}[/red]")
+            raise typer.Exit(1) from None
 
     if max_turns:
         settings.agent.max_turns = max_turns
@@ -126,28 +168,29 @@ def run(
         settings.agent.cwd = cwd
 
     # Get prompt
-    task_prompt = prompt
-    if prompt_file and prompt_file.exists():
-        task_prompt = prompt_file.read_text()
-    elif not task_prompt:
-        task_prompt = settings.get_task_prompt()
+    task_prompt = resolve_prompt(prompt, prompt_file, settings)
 
     if not task_prompt:
         console.print("[red]Error: No prompt provided. Use argument or --prompt-file[/red]")
         raise typer.Exit(1)
 
     # Run agent
+    import asyncio
+
+    from claude_agent_framework.core.runner import AgentRunner
+
     runner = AgentRunner(settings, console=console if not quiet else None)
 
     async def execute():
-        return await runner.run_once(task_prompt, task_description=task_prompt[:100])
+        async with runner:
+            return await runner.run_once(task_prompt, task_description=task_prompt[:100])
 
     result = asyncio.run(execute())
 
     # Output result
     if json_output:
-        import json
-        console.print(json.dumps(result.to_dict(), indent=2, default=str))
+        import orjson
+        typer.echo(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2, default=str))
     elif not quiet:
         if not result.is_success:
             console.print(f"[red]Agent failed: {result.error}[/red]")
@@ -201,16 +244,14 @@ def service(
     settings.service_interval_seconds = interval
 
     # Get prompt
-    task_prompt = prompt
-    if prompt_file and prompt_file.exists():
-        task_prompt = prompt_file.read_text()
-    elif not task_prompt:
-        task_prompt = settings.get_task_prompt()
+    task_prompt = resolve_prompt(prompt, prompt_file, settings)
 
     if not task_prompt:
         console.print("[red]Error: No prompt provided.[/red]")
         raise typer.Exit(1)
 
+    from rich.panel import Panel
+
     console.print(Panel(
         f"[cyan]Starting service mode[/cyan]\n"
         f"Interval: {interval}s\n"
@@ -219,9 +260,17 @@ def service(
         title="Claude Agent Service",
     ))
 
+    import asyncio
+
+    from claude_agent_framework.core.runner import AgentRunner
+
     runner = AgentRunner(settings, console=console)
 
-    asyncio.run(runner.run_service(task_prompt, task_description=task_prompt[:100]))
+    async def execute():
+        async with runner:
+            await runner.run_service(task_prompt, task_description=task_prompt[:100])
+
+    asyncio.run(execute())
 
 
 @app.command()
@@ -264,20 +313,25 @@ def cron(
         caf cron "Daily backup check" --schedule "0 2 * * *"
         caf cron -f prompts/hourly.md -s "0 * * * *"
     """
+    from croniter import croniter
+
+    # Fail fast on a bad schedule, before loading settings or the runner
+    if not croniter.is_valid(schedule):
+        console.print(f"[red]Error: Invalid cron schedule '{schedule}'.[/red]")
+        raise typer.Exit(1)
+
     settings = load_config(env_file, config_file)
     settings.cron_schedule = schedule
 
     # Get prompt
-    task_prompt = prompt
-    if prompt_file and prompt_file.exists():
-        task_prompt = prompt_file.read_text()
-    elif not task_prompt:
-        task_prompt = settings.get_task_prompt()
+    task_prompt = resolve_prompt(prompt, prompt_file, settings)
 
     if not task_prompt:
         console.print("[red]Error: No prompt provided.[/red]")
         raise typer.Exit(1)
 
+    from rich.panel import Panel
+
     console.print(Panel(
         f"[cyan]Starting cron mode[/cyan]\n"
         f"Schedule: {schedule}\n"
@@ -286,9 +340,17 @@ def cron(
         title="Claude Agent Cron",
     ))
 
+    import asyncio
+
+    from claude_agent_framework.core.runner import AgentRunner
+
     runner = AgentRunner(settings, console=console)
 
-    asyncio.run(runner.run_with_cron(task_prompt, task_description=task_prompt[:100]))
+    async def execute():
+        async with runner:
+            await runner.run_with_cron(task_prompt, task_description=task_prompt[:100])
+
+    asyncio.run(execute())
 
 
 @app.command()
@@ -311,11 +373,11 @@ def config(
         "-t",
         help="Launch interactive TUI",
     ),
-    output_dir: Path = typer.Option(
-        Path.cwd(),
+    output_dir: Path | None = typer.Option(
+        None,
         "--output",
         "-o",
-        help="Output directory for generated files",
+        help="Output directory for generated files (default: current directory)",
     ),
 ) -> None:
     """
@@ -328,11 +390,15 @@ def config(
         caf config --show
         caf config --tui
     """
+    output_dir = output_dir or Path.cwd()
+
     if tui:
         from claude_agent_framework.tui import main as tui_main
         tui_main(config_dir=output_dir)
         return
 
+    from claude_agent_framework.config.settings import Settings
+
     settings = Settings()
 
     if generate_env:
@@ -343,16 +409,29 @@ def config(
         return
 
     if show:
-        import yaml
-        config_dict = settings.model_dump(exclude_none=True)
-        # Mask sensitive values
-        if config_dict.get("anthropic_api_key"):
-            key = config_dict["anthropic_api_key"]
-            config_dict["anthropic_api_key"] = f"{key[:8]}...{key[-4:]}" if len(key) > 12 else "***"
-        if config_dict.get("slack", {}).get("webhook_url"):
+        from claude_agent_framework.utils.helpers import yaml_dump
+
+        # Secrets are left out of the dump and added back masked
+        config_dict = settings.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude={
+                "anthropic_api_key": True,
+                "claude_code_oauth_token": True,
+                "slack": {"webhook_url"},
+                "webhook": {"linear_webhook_secret"},
+            },
+        )
+        for name in ("anthropic_api_key", "claude_code_oauth_token"):
+            key = getattr(settings, name)
+            if key:
+                config_dict[name] = f"{key[:8]}...{key[-4:]}" if len(key) > 12 else "***"
+        if settings.slack.webhook_url:
             config_dict["slack"]["webhook_url"] = "***"
+        if settings.webhook.linear_webhook_secret:
+            config_dict["webhook"]["linear_webhook_secret"] = "***"
 
-        yaml_str = yaml.dump(config_dict, default_flow_style=False)
+        yaml_str = yaml_dump(config_dict, default_flow_style=False)
         from rich.syntax import Syntax
         console.print(Syntax(yaml_str, "yaml", theme="monokai"))
         return
@@ -381,6 +460,12 @@ def costs(
         "-r",
         help="Reset cost tracking",
     ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Skip the confirmation prompt",
+    ),
 ) -> None:
     """
     View cost tracking information.
@@ -390,25 +475,28 @@ def costs(
     Examples:
         caf costs
         caf costs --reset
+        caf costs --reset --yes
     """
     settings = load_config(env_file, config_file)
 
     from claude_agent_framework.tracking.cost_tracker import CostTracker
 
-    cost_storage = settings.logging.log_dir / "costs.json"
+    cost_storage = settings.logging.log_dir / "costs.jsonl"
     tracker = CostTracker(
         storage_path=cost_storage,
         budget_limit_usd=settings.agent.max_budget_usd,
     )
 
     if reset:
-        if typer.confirm("Reset all cost tracking data?"):
+        if yes or typer.confirm("Reset all cost tracking data?"):
             tracker.reset()
             console.print("[green]Cost tracking reset.[/green]")
         return
 
     report = tracker.get_report()
 
+    from rich.table import Table
+
     table = Table(title="Cost Report")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
@@ -418,6 +506,8 @@ def costs(
     table.add_row("Total Tokens", f"{report['total_tokens']:,}")
     table.add_row("Input Tokens", f"{report['total_input_tokens']:,}")
     table.add_row("Output Tokens", f"{report['total_output_tokens']:,}")
+    table.add_row("Cache Write Tokens", f"{report['total_cache_creation_tokens']:,}")
+    table.add_row("Cache Read Tokens", f"{report['total_cache_read_tokens']:,}")
     table.add_row("Avg Cost/Session", f"${report['average_cost_per_session']:.4f}")
 
     if report['budget_limit_usd']:
@@ -475,6 +565,8 @@ def auth(
     engine = AgentEngine(settings)
     auth_info = engine.get_auth_info()
 
+    from rich.table import Table
+
     table = Table(title="Authentication Configuration")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
@@ -527,6 +619,12 @@ def webhook(
         "-r",
         help="Path to webhook routes YAML file",
     ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Start even if the webhook server is disabled in config",
+    ),
 ) -> None:
     """
     Start webhook server to trigger agents from external events.
@@ -552,9 +650,10 @@ def webhook(
         routes = create_default_linear_routes()
         output_file = routes_file or Path("webhook_routes.yaml")
 
-        import yaml
-        routes_data = [route.model_dump() for route in routes]
-        output_file.write_text(yaml.dump(routes_data, default_flow_style=False))
+        from claude_agent_framework.utils.helpers import yaml_dump
+
+        routes_data = [route.model_dump(mode="json") for route in routes]
+        output_file.write_text(yaml_dump(routes_data, default_flow_style=False))
 
         console.print(f"[green]Generated webhook routes file: {output_file}[/green]")
         console.print("\nEdit this file to customize webhook routing rules.")
@@ -563,9 +662,9 @@ def webhook(
         return
 
     # Validate webhook configuration
-    if not settings.webhook.enabled and not typer.confirm(
+    if not settings.webhook.enabled and not (yes or typer.confirm(
         "Webhook server is not enabled in config. Start anyway?"
-    ):
+    )):
         console.print("[yellow]Webhook server start cancelled.[/yellow]")
         return
 
@@ -576,20 +675,18 @@ def webhook(
         )
         console.print("Set CAF_WEBHOOK__LINEAR_WEBHOOK_SECRET in your .env file.\n")
 
-    # Start the webhook server
-    from claude_agent_framework.webhook.server import WebhookServer
-
-    server = WebhookServer(settings)
-
-    # Display startup information
+    # Display startup information before building the server, so it is
+    # shown even if server construction fails
     actual_host = host or settings.webhook.host
     actual_port = port or settings.webhook.port
 
+    from rich.panel import Panel
+
     console.print(Panel(
         f"[cyan]Webhook Server Starting[/cyan]\n\n"
         f"Host: {actual_host}\n"
         f"Port: {actual_port}\n"
-        f"Routes configured: {len(server.handler.route_rules)}\n\n"
+        f"Routes file: {settings.webhook.routes_file or 'none'}\n\n"
         f"Endpoints:\n"
         f"  [green]POST[/green] http://{actual_host}:{actual_port}/webhooks/linear\n"
         f"  [green]GET[/green]  http://{actual_host}:{actual_port}/health\n\n"
@@ -597,6 +694,12 @@ def webhook(
         title="Claude Agent Framework - Webhook Server",
     ))
 
+    # Start the webhook server
+    from claude_agent_framework.webhook.server import WebhookServer
+
+    server = WebhookServer(settings)
+    console.print(f"Routes configured: {len(server.handler.route_rules)}")
+
     try:
         server.run(host=host, port=port)
     except KeyboardInterrupt:
@@ -608,11 +711,7 @@ def version() -> None:
     """Show version information."""
     from claude_agent_framework import __version__
 
-    console.print(Panel(
-        f"[cyan]Claude Agent Framework[/cyan]\n"
-        f"Version: {__version__}",
-        title="Version Info",
-    ))
+    typer.echo(f"Claude Agent Framework v{__version__}")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,32 @@
 """Configuration management for Claude Agent Framework."""
 
-from claude_agent_framework.config.settings import (
-    AgentConfig,
-    BedrockConfig,
-    LoggingConfig,
-    MCPServerConfig,
-    Settings,
-    SlackConfig,
-    SubAgentConfig,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from claude_agent_framework._lazy import attach
+
+if TYPE_CHECKING:
+    from claude_agent_framework.config.settings import (
+        AgentConfig,
+        BedrockConfig,
+        LoggingConfig,
+        MCPServerConfig,
+        Settings,
+        SlackConfig,
+        SubAgentConfig,
+    )
+
+# Re-exports resolve on first access (PEP 562), matching the package root
+_LAZY_IMPORTS = {
+    "Settings": "claude_agent_framework.config.settings",
+    "AgentConfig": "claude_agent_framework.config.settings",
+    "SubAgentConfig": "claude_agent_framework.config.settings",
+    "MCPServerConfig": "claude_agent_framework.config.settings",
+    "SlackConfig": "claude_agent_framework.config.settings",
+    "LoggingConfig": "claude_agent_framework.config.settings",
+    "BedrockConfig": "claude_agent_framework.config.settings",
+}
 
 __all__ = [
     "Settings",
@@ -19,3 +37,6 @@ __all__ = [
     "LoggingConfig",
     "BedrockConfig",
 ]
+
+
+__getattr__, __dir__ = attach(__name__, _LAZY_IMPORTS)
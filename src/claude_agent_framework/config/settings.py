@@ -6,13 +6,14 @@ All settings can be configured via environment variables or .env file.
 
 from __future__ import annotations
 
-import json
 import os
+import re
 import warnings
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -53,6 +54,23 @@ class SubAgentConfig(BaseModel):
     model_config = {"extra": "forbid"}
 
 
+# Potentially dangerous patterns in MCP server commands, with the risk each
+# implies. Compiled into one alternation so a command is scanned once; the
+# leftmost match is reported.
+_DANGEROUS_COMMAND_PATTERNS = {
+    "rm ": "file deletion",
+    "sudo ": "privilege escalation",
+    "curl | sh": "remote code execution",
+    "wget | sh": "remote code execution",
+    "|": "shell piping",
+    "&&": "command chaining",
+    ";": "command separation",
+    "`": "command substitution",
+    "$(": "command substitution",
+}
+_DANGEROUS_COMMAND_RE = re.compile("|".join(map(re.escape, _DANGEROUS_COMMAND_PATTERNS)))
+
+
 class MCPServerConfig(BaseModel):
     """Configuration for an MCP server."""
     name: str = Field(..., description="Server name/identifier")
@@ -75,27 +93,15 @@ class MCPServerConfig(BaseModel):
         if v is None:
             return None
 
-        # List of potentially dangerous patterns
-        dangerous_patterns = [
-            ("rm ", "file deletion"),
-            ("sudo ", "privilege escalation"),
-            ("curl | sh", "remote code execution"),
-            ("wget | sh", "remote code execution"),
-            ("|", "shell piping"),
-            ("&&", "command chaining"),
-            (";", "command separation"),
-            ("`", "command substitution"),
-            ("$(", "command substitution"),
-        ]
-
-        for pattern, risk in dangerous_patterns:
-            if pattern in v:
-                warnings.warn(
-                    f"MCP server command contains potentially dangerous pattern '{pattern}' "
-                    f"({risk}): {v}. Ensure this is from a trusted source.",
-                    stacklevel=2
-                )
-                break
+        match = _DANGEROUS_COMMAND_RE.search(v)
+        if match:
+            pattern = match.group()
+            warnings.warn(
+                f"MCP server command contains potentially dangerous pattern '{pattern}' "
+                f"({_DANGEROUS_COMMAND_PATTERNS[pattern]}): {v}. "
+                "Ensure this is from a trusted source.",
+                stacklevel=2
+            )
 
         return v
 
@@ -111,6 +117,11 @@ class SlackConfig(BaseModel):
     notify_on_error: bool = Field(default=True, description="Notify on errors")
     include_cost: bool = Field(default=True, description="Include cost info in message")
     include_duration: bool = Field(default=True, description="Include duration in message")
+    batch_window_seconds: float = Field(
+        default=0,
+        ge=0,
+        description="Coalesce results within this window into one summary message (0 = send each)",
+    )
 
     model_config = {"extra": "forbid"}
 
@@ -186,6 +197,10 @@ class SandboxConfig(BaseModel):
     model_config = {"extra": "forbid"}
 
 
+# System locations an agent working directory should not normally point at
+_UNSAFE_CWD_PREFIXES = ("/etc", "/root", "/sys", "/proc")
+
+
 class AgentConfig(BaseModel):
     """Core agent configuration."""
     name: str = Field(default="claude-agent", description="Agent name")
@@ -253,7 +268,7 @@ class AgentConfig(BaseModel):
 
             # Security check: warn if path contains suspicious patterns
             path_str = str(path)
-            if ".." in path_str or path_str.startswith("/etc") or path_str.startswith("/root"):
+            if ".." in path_str or path_str.startswith(_UNSAFE_CWD_PREFIXES):
                 warnings.warn(
                     f"Working directory path contains potentially unsafe location: {path_str}. "
                     "Ensure this is intentional.",
@@ -264,6 +279,111 @@ class AgentConfig(BaseModel):
         return v
 
 
+# Static .env template returned by Settings.generate_env_template
+_ENV_TEMPLATE = "\n".join([
+    "# Claude Agent Framework Configuration",
+    "# =====================================",
+    "",
+    "# API Configuration",
+    "# -----------------",
+    "# Anthropic API key (required unless using Bedrock or OAuth token)",
+    "ANTHROPIC_API_KEY=",
+    "",
+    "# Claude Code OAuth Token (alternative to API key)",
+    "# Generate a long-lived token (1 year) with: claude setup-token",
+    "# CAF_CLAUDE_CODE_OAUTH_TOKEN=sk-ant-oat01-...",
+    "",
+    "# Agent Configuration",
+    "# -------------------",
+    "CAF_AGENT__NAME=claude-agent",
+    "CAF_AGENT__MODEL=sonnet",
+    "CAF_AGENT__MAX_TURNS=50",
+    "CAF_AGENT__PERMISSION_MODE=acceptEdits",
+    "",
+    "# System Prompt Configuration",
+    "# ---------------------------",
+    "# Options: preset, custom, append",
+    "CAF_AGENT__SYSTEM_PROMPT_TYPE=preset",
+    "CAF_AGENT__SYSTEM_PROMPT_PRESET=claude_code",
+    "# CAF_AGENT__SYSTEM_PROMPT_CONTENT=Your custom prompt here",
+    "",
+    "# Budget and Limits",
+    "# -----------------",
+    "# CAF_AGENT__MAX_BUDGET_USD=10.0",
+    "# CAF_AGENT__MAX_THINKING_TOKENS=5000",
+    "",
+    "# Working Directory",
+    "# -----------------",
+    "# CAF_AGENT__CWD=/path/to/project",
+    "",
+    "# AWS Bedrock Configuration",
+    "# -------------------------",
+    "CAF_BEDROCK__ENABLED=false",
+    "CAF_BEDROCK__REGION=us-east-1",
+    "# CAF_BEDROCK__PROFILE=default",
+    "# CAF_BEDROCK__MODEL_ID=global.anthropic.claude-sonnet-4-5-20250929-v1:0",
+    "",
+    "# Sandbox Configuration",
+    "# ---------------------",
+    "CAF_SANDBOX__ENABLED=false",
+    "CAF_SANDBOX__AUTO_ALLOW_BASH=false",
+    "",
+    "# Slack Notifications",
+    "# -------------------",
+    "CAF_SLACK__ENABLED=false",
+    "CAF_SLACK__WEBHOOK_URL=",
+    "CAF_SLACK__USERNAME=Claude Agent",
+    "CAF_SLACK__NOTIFY_ON_SUCCESS=true",
+    "CAF_SLACK__NOTIFY_ON_ERROR=true",
+    "CAF_SLACK__INCLUDE_COST=true",
+    "",
+    "# Logging Configuration",
+    "# ---------------------",
+    "CAF_LOGGING__ENABLED=true",
+    "CAF_LOGGING__LOG_DIR=./logs",
+    "CAF_LOGGING__LOG_LEVEL=INFO",
+    "CAF_LOGGING__LOG_AGENT_TRACE=true",
+    "CAF_LOGGING__SEPARATE_TRACE_FILE=true",
+    "",
+    "# Task Configuration",
+    "# ------------------",
+    "# CAF_TASK_PROMPT=Your task prompt here",
+    "# CAF_TASK_PROMPT_FILE=./prompts/task.md",
+    "",
+    "# Service Mode",
+    "# ------------",
+    "CAF_SERVICE_MODE=false",
+    "CAF_SERVICE_INTERVAL_SECONDS=3600",
+    "# CAF_CRON_SCHEDULE=0 * * * *",
+    "",
+    "# Response Cache",
+    "# --------------",
+    "# Reuse results of identical prompts (stored in the log directory)",
+    "# CAF_RESPONSE_CACHE_TTL_SECONDS=3600",
+    "",
+    "# Session Management",
+    "# ------------------",
+    "# CAF_SESSION_ID=",
+    "# CAF_CONTINUE_CONVERSATION=false",
+    "",
+    "# Configuration Files",
+    "# -------------------",
+    "# CAF_CONFIG_FILE=./config.yaml",
+    "# CAF_SUB_AGENTS_FILE=./sub_agents.yaml",
+    "# CAF_MCP_SERVERS_FILE=./mcp_servers.yaml",
+    "",
+    "# Sub-agents (JSON format)",
+    "# ------------------------",
+    '# CAF_SUB_AGENTS=[{"name":"code-reviewer","description":"Reviews code",'
+    '"prompt":"You are a code reviewer...","tools":["Read","Grep"]}]',
+    "",
+    "# MCP Servers (JSON format)",
+    "# -------------------------",
+    '# CAF_MCP_SERVERS=[{"name":"filesystem","type":"stdio","command":"npx",'
+    '"args":["@modelcontextprotocol/server-filesystem"]}]',
+])
+
+
 class Settings(BaseSettings):
     """
     Main settings class - loads from environment variables and .env file.
@@ -336,6 +456,12 @@ class Settings(BaseSettings):
     service_interval_seconds: int = Field(default=3600, description="Interval between runs")
     cron_schedule: str | None = Field(default=None, description="Cron schedule expression")
 
+    # Response Cache
+    response_cache_ttl_seconds: int | None = Field(
+        default=None,
+        description="Reuse results of identical prompts for this many seconds (None = disabled)"
+    )
+
     # Session Management
     session_id: str | None = Field(default=None, description="Session ID to resume")
     continue_conversation: bool = Field(default=False, description="Continue previous session")
@@ -350,9 +476,9 @@ class Settings(BaseSettings):
     def parse_sub_agents(cls, v: Any) -> list[SubAgentConfig]:
         if isinstance(v, str):
             try:
-                data = json.loads(v)
+                data = orjson.loads(v)
                 return [SubAgentConfig(**item) for item in data]
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return []
         return v or []
 
@@ -361,9 +487,9 @@ class Settings(BaseSettings):
     def parse_mcp_servers(cls, v: Any) -> list[MCPServerConfig]:
         if isinstance(v, str):
             try:
-                data = json.loads(v)
+                data = orjson.loads(v)
                 return [MCPServerConfig(**item) for item in data]
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return []
         return v or []
 
@@ -371,143 +497,38 @@ class Settings(BaseSettings):
         """Get the task prompt from direct value or file."""
         if self.task_prompt:
             return self.task_prompt
-        if self.task_prompt_file and self.task_prompt_file.exists():
-            return self.task_prompt_file.read_text()
+        if self.task_prompt_file:
+            try:
+                return self.task_prompt_file.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                pass
         return None
 
     @classmethod
     def load_from_yaml(cls, config_path: Path) -> Settings:
         """Load settings from a YAML configuration file."""
-        import yaml
+        from claude_agent_framework.utils.helpers import yaml_load
 
         with open(config_path) as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml_load(f)
 
         return cls(**config_data)
 
     def save_to_yaml(self, config_path: Path) -> None:
         """Save settings to a YAML configuration file."""
-        import yaml
-
-        # Convert to dict, excluding None values and defaults
-        data = self.model_dump(exclude_none=True, exclude_defaults=True)
+        from claude_agent_framework.utils.helpers import yaml_dump
 
-        # Convert Path objects and Enum values to strings
-        def convert_values(obj: Any) -> Any:
-            if isinstance(obj, Path):
-                return str(obj)
-            if isinstance(obj, Enum):
-                return obj.value
-            if isinstance(obj, dict):
-                return {k: convert_values(v) for k, v in obj.items()}
-            if isinstance(obj, list):
-                return [convert_values(item) for item in obj]
-            return obj
-
-        data = convert_values(data)
+        # Convert to dict, excluding None values and defaults; JSON mode
+        # turns Path objects and Enum values into plain strings
+        data = self.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
 
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(config_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml_dump(data, f, default_flow_style=False, sort_keys=False)
 
     def generate_env_template(self) -> str:
         """Generate a .env template with all available settings."""
-        lines = [
-            "# Claude Agent Framework Configuration",
-            "# =====================================",
-            "",
-            "# API Configuration",
-            "# -----------------",
-            "# Anthropic API key (required unless using Bedrock or OAuth token)",
-            "ANTHROPIC_API_KEY=",
-            "",
-            "# Claude Code OAuth Token (alternative to API key)",
-            "# Generate a long-lived token (1 year) with: claude setup-token",
-            "# CAF_CLAUDE_CODE_OAUTH_TOKEN=sk-ant-oat01-...",
-            "",
-            "# Agent Configuration",
-            "# -------------------",
-            "CAF_AGENT__NAME=claude-agent",
-            "CAF_AGENT__MODEL=sonnet",
-            "CAF_AGENT__MAX_TURNS=50",
-            "CAF_AGENT__PERMISSION_MODE=acceptEdits",
-            "",
-            "# System Prompt Configuration",
-            "# ---------------------------",
-            "# Options: preset, custom, append",
-            "CAF_AGENT__SYSTEM_PROMPT_TYPE=preset",
-            "CAF_AGENT__SYSTEM_PROMPT_PRESET=claude_code",
-            "# CAF_AGENT__SYSTEM_PROMPT_CONTENT=Your custom prompt here",
-            "",
-            "# Budget and Limits",
-            "# -----------------",
-            "# CAF_AGENT__MAX_BUDGET_USD=10.0",
-            "# CAF_AGENT__MAX_THINKING_TOKENS=5000",
-            "",
-            "# Working Directory",
-            "# -----------------",
-            "# CAF_AGENT__CWD=/path/to/project",
-            "",
-            "# AWS Bedrock Configuration",
-            "# -------------------------",
-            "CAF_BEDROCK__ENABLED=false",
-            "CAF_BEDROCK__REGION=us-east-1",
-            "# CAF_BEDROCK__PROFILE=default",
-            "# CAF_BEDROCK__MODEL_ID=global.anthropic.claude-sonnet-4-5-20250929-v1:0",
-            "",
-            "# Sandbox Configuration",
-            "# ---------------------",
-            "CAF_SANDBOX__ENABLED=false",
-            "CAF_SANDBOX__AUTO_ALLOW_BASH=false",
-            "",
-            "# Slack Notifications",
-            "# -------------------",
-            "CAF_SLACK__ENABLED=false",
-            "CAF_SLACK__WEBHOOK_URL=",
-            "CAF_SLACK__USERNAME=Claude Agent",
-            "CAF_SLACK__NOTIFY_ON_SUCCESS=true",
-            "CAF_SLACK__NOTIFY_ON_ERROR=true",
-            "CAF_SLACK__INCLUDE_COST=true",
-            "",
-            "# Logging Configuration",
-            "# ---------------------",
-            "CAF_LOGGING__ENABLED=true",
-            "CAF_LOGGING__LOG_DIR=./logs",
-            "CAF_LOGGING__LOG_LEVEL=INFO",
-            "CAF_LOGGING__LOG_AGENT_TRACE=true",
-            "CAF_LOGGING__SEPARATE_TRACE_FILE=true",
-            "",
-            "# Task Configuration",
-            "# ------------------",
-            "# CAF_TASK_PROMPT=Your task prompt here",
-            "# CAF_TASK_PROMPT_FILE=./prompts/task.md",
-            "",
-            "# Service Mode",
-            "# ------------",
-            "CAF_SERVICE_MODE=false",
-            "CAF_SERVICE_INTERVAL_SECONDS=3600",
-            "# CAF_CRON_SCHEDULE=0 * * * *",
-            "",
-            "# Session Management",
-            "# ------------------",
-            "# CAF_SESSION_ID=",
-            "# CAF_CONTINUE_CONVERSATION=false",
-            "",
-            "# Configuration Files",
-            "# -------------------",
-            "# CAF_CONFIG_FILE=./config.yaml",
-            "# CAF_SUB_AGENTS_FILE=./sub_agents.yaml",
-            "# CAF_MCP_SERVERS_FILE=./mcp_servers.yaml",
-            "",
-            "# Sub-agents (JSON format)",
-            "# ------------------------",
-            '# CAF_SUB_AGENTS=[{"name":"code-reviewer","description":"Reviews code","prompt":"You are a code reviewer...","tools":["Read","Grep"]}]',
-            "",
-            "# MCP Servers (JSON format)",
-            "# -------------------------",
-            '# CAF_MCP_SERVERS=[{"name":"filesystem","type":"stdio","command":"npx","args":["@modelcontextprotocol/server-filesystem"]}]',
-        ]
-        return "\n".join(lines)
+        return _ENV_TEMPLATE
 
 
 def load_settings(
@@ -538,8 +559,10 @@ def load_settings(
             settings.claude_code_oauth_token = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN")
         return settings
 
-    # Load settings from env
-    settings = Settings(_env_file=env_file or ".env")
+    # Load settings from env; the .env values are already in os.environ
+    # (with real environment variables taking precedence), so don't have
+    # pydantic-settings parse the same file a second time
+    settings = Settings(_env_file=None)
 
     # Also check for CLAUDE_CODE_OAUTH_TOKEN without CAF_ prefix (SDK convention)
     if not settings.claude_code_oauth_token:
@@ -553,23 +576,15 @@ def _load_env_file(env_file: Path) -> None:
     if not env_file.exists():
         return
 
+    from dotenv import dotenv_values
+
     try:
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-                # Parse KEY=VALUE
-                if "=" in line:
-                    key, _, value = line.partition("=")
-                    key = key.strip()
-                    value = value.strip()
-                    # Remove quotes if present
-                    if value and value[0] == value[-1] and value[0] in ("'", '"'):
-                        value = value[1:-1]
-                    # Only set if not already in environment
-                    if key and value and key not in os.environ:
-                        os.environ[key] = value
+        values = dotenv_values(env_file, encoding="utf-8")
     except Exception as e:
         warnings.warn(f"Failed to parse .env file {env_file}: {e}", stacklevel=2)
+        return
+
+    for key, value in values.items():
+        # Only set if not already in environment
+        if value and key not in os.environ:
+            os.environ[key] = value
@@ -1,8 +1,24 @@
 """Core agent engine and runner components."""
 
-from claude_agent_framework.core.engine import AgentEngine
-from claude_agent_framework.core.result import AgentResult, AgentStatus
-from claude_agent_framework.core.runner import AgentRunner
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from claude_agent_framework._lazy import attach
+
+if TYPE_CHECKING:
+    from claude_agent_framework.core.engine import AgentEngine
+    from claude_agent_framework.core.result import AgentResult, AgentStatus
+    from claude_agent_framework.core.runner import AgentRunner
+
+# Resolved on first access (PEP 562). Importing core.result from the tracking
+# modules must not pull in core.runner, which imports them back.
+_LAZY_IMPORTS = {
+    "AgentEngine": "claude_agent_framework.core.engine",
+    "AgentRunner": "claude_agent_framework.core.runner",
+    "AgentResult": "claude_agent_framework.core.result",
+    "AgentStatus": "claude_agent_framework.core.result",
+}
 
 __all__ = [
     "AgentEngine",
@@ -10,3 +26,6 @@ __all__ = [
     "AgentResult",
     "AgentStatus",
 ]
+
+
+__getattr__, __dir__ = attach(__name__, _LAZY_IMPORTS)
@@ -8,8 +8,10 @@ with the Claude Agent SDK, including configuration, execution, and result proces
 from __future__ import annotations
 
 import os
+import time
 from collections.abc import AsyncIterator, Callable
 from datetime import datetime
+from functools import partial
 from typing import Any, Literal
 
 from claude_agent_sdk import (
@@ -40,6 +42,7 @@ from claude_agent_sdk.types import (
 )
 
 from claude_agent_framework.config.settings import (
+    MCPServerConfig,
     MCPServerType,
     PermissionMode,
     Settings,
@@ -54,6 +57,60 @@ from claude_agent_framework.core.result import (
 )
 from claude_agent_framework.tracking.logger import AgentLogger
 
+_SdkPermissionMode = Literal['default', 'acceptEdits', 'bypassPermissions', 'plan']
+_SdkMcpServerConfig = McpStdioServerConfig | McpSSEServerConfig | McpHttpServerConfig
+
+# Permission mode mapping to the SDK's literal values
+_PERMISSION_MODES: dict[PermissionMode, _SdkPermissionMode] = {
+    PermissionMode.DEFAULT: "default",
+    PermissionMode.ACCEPT_EDITS: "acceptEdits",
+    PermissionMode.BYPASS_PERMISSIONS: "bypassPermissions",
+    PermissionMode.PLAN: "plan",
+}
+
+# SDK config builders for each MCP server type (SDK servers are not built here)
+_MCP_SERVER_BUILDERS: dict[MCPServerType, Callable[[MCPServerConfig], _SdkMcpServerConfig]] = {
+    MCPServerType.STDIO: lambda s: McpStdioServerConfig(
+        command=s.command or "", args=s.args, env=s.env
+    ),
+    MCPServerType.SSE: lambda s: McpSSEServerConfig(url=s.url or "", headers=s.headers),
+    MCPServerType.HTTP: lambda s: McpHttpServerConfig(url=s.url or "", headers=s.headers),
+}
+
+# Result message subtypes and the status each maps to
+_RESULT_STATUSES = {
+    "success": AgentStatus.SUCCESS,
+    "error_max_turns": AgentStatus.MAX_TURNS_REACHED,
+    "error_during_execution": AgentStatus.ERROR,
+    "error_max_structured_output_retries": AgentStatus.ERROR,
+}
+
+# SDK usage keys and the TokenUsage fields they map to
+_USAGE_FIELDS = (
+    ("input_tokens", "input_tokens"),
+    ("output_tokens", "output_tokens"),
+    ("cache_creation_input_tokens", "cache_creation_tokens"),
+    ("cache_read_input_tokens", "cache_read_tokens"),
+)
+
+# Message handler methods keyed by exact SDK message type (looked up by name
+# so subclasses can still override them)
+_MESSAGE_HANDLERS: dict[type, str] = {
+    SDKSystemMessage: "_process_system_message",
+    SDKAssistantMessage: "_process_assistant_message",
+    SDKUserMessage: "_process_user_message",
+    SDKResultMessage: "_process_result_message",
+}
+
+# Content block converters keyed by exact SDK block type
+_BLOCK_CONVERTERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    TextBlock: lambda b: {"type": "text", "text": b.text},
+    ToolUseBlock: lambda b: {"type": "tool_use", "name": b.name, "input": b.input, "id": b.id},
+    ToolResultBlock: lambda b: {
+        "type": "tool_result", "tool_use_id": b.tool_use_id, "content": b.content
+    },
+}
+
 
 class AgentEngine:
     """
@@ -119,7 +176,8 @@ class AgentEngine:
                 os.environ["ANTHROPIC_MODEL"] = self.settings.bedrock.bedrock_model_id
 
             if self.settings.bedrock.bedrock_small_model_id:
-                os.environ["ANTHROPIC_SMALL_FAST_MODEL"] = self.settings.bedrock.bedrock_small_model_id
+                small_model_id = self.settings.bedrock.bedrock_small_model_id
+                os.environ["ANTHROPIC_SMALL_FAST_MODEL"] = small_model_id
 
     def get_auth_info(self) -> dict[str, Any]:
         """Get information about the current authentication configuration.
@@ -136,15 +194,16 @@ class AgentEngine:
         """
         api_key = self.settings.anthropic_api_key or os.environ.get("ANTHROPIC_API_KEY", "")
         oauth_token = os.environ.get("CLAUDE_CODE_OAUTH_TOKEN", "")
-        bedrock_enabled = self.settings.bedrock.enabled or os.environ.get("CLAUDE_CODE_USE_BEDROCK") == "1"
+        bedrock = self.settings.bedrock
+        bedrock_enabled = bedrock.enabled or os.environ.get("CLAUDE_CODE_USE_BEDROCK") == "1"
         vertex_enabled = os.environ.get("CLAUDE_CODE_USE_VERTEX") == "1"
 
         if bedrock_enabled:
             return {
                 "method": "AWS Bedrock",
-                "region": self.settings.bedrock.region or os.environ.get("AWS_REGION", "us-east-1"),
-                "profile": self.settings.bedrock.profile or os.environ.get("AWS_PROFILE", "default"),
-                "model_id": self.settings.bedrock.bedrock_model_id or os.environ.get("ANTHROPIC_MODEL", "auto"),
+                "region": bedrock.region or os.environ.get("AWS_REGION", "us-east-1"),
+                "profile": bedrock.profile or os.environ.get("AWS_PROFILE", "default"),
+                "model_id": bedrock.bedrock_model_id or os.environ.get("ANTHROPIC_MODEL", "auto"),
             }
         elif vertex_enabled:
             return {
@@ -163,7 +222,9 @@ class AgentEngine:
             }
         elif oauth_token:
             # OAuth token from Claude Code CLI login
-            masked_token = f"{oauth_token[:10]}...{oauth_token[-4:]}" if len(oauth_token) > 14 else "<set>"
+            masked_token = (
+                f"{oauth_token[:10]}...{oauth_token[-4:]}" if len(oauth_token) > 14 else "<set>"
+            )
             return {
                 "method": "Claude Code OAuth",
                 "oauth_token": masked_token,
@@ -228,43 +289,28 @@ class AgentEngine:
         if not self.settings.sub_agents:
             return None
 
-        agents: dict[str, AgentDefinition] = {}
-        for agent in self.settings.sub_agents:
-            agents[agent.name] = AgentDefinition(
+        return {
+            agent.name: AgentDefinition(
                 description=agent.description,
                 prompt=agent.prompt,
                 tools=agent.tools,
                 model=agent.model.value if agent.model else None,
             )
+            for agent in self.settings.sub_agents
+        }
 
-        return agents
-
-    def _build_mcp_servers_config(self) -> dict[str, McpStdioServerConfig | McpSSEServerConfig | McpHttpServerConfig] | None:
+    def _build_mcp_servers_config(self) -> dict[str, _SdkMcpServerConfig] | None:
         """Build MCP servers configuration."""
         if not self.settings.mcp_servers:
             return None
 
-        servers: dict[str, McpStdioServerConfig | McpSSEServerConfig | McpHttpServerConfig] = {}
-        for server in self.settings.mcp_servers:
-            if server.type == MCPServerType.STDIO:
-                servers[server.name] = McpStdioServerConfig(
-                    command=server.command or "",
-                    args=server.args,
-                    env=server.env,
-                )
-            elif server.type == MCPServerType.SSE:
-                servers[server.name] = McpSSEServerConfig(
-                    url=server.url or "",
-                    headers=server.headers,
-                )
-            elif server.type == MCPServerType.HTTP:
-                servers[server.name] = McpHttpServerConfig(
-                    url=server.url or "",
-                    headers=server.headers,
-                )
-            # SDK type servers are handled separately
-
-        return servers if servers else None
+        # SDK type servers are handled separately
+        servers = {
+            server.name: _MCP_SERVER_BUILDERS[server.type](server)
+            for server in self.settings.mcp_servers
+            if server.type in _MCP_SERVER_BUILDERS
+        }
+        return servers or None
 
     def _build_sandbox_config(self) -> SandboxSettings | None:
         """Build sandbox configuration."""
@@ -277,14 +323,6 @@ class AgentEngine:
 
     def _build_options(self) -> ClaudeAgentOptions:
         """Build the complete options object for the SDK."""
-        # Permission mode mapping
-        permission_map: dict[PermissionMode, Literal['default', 'acceptEdits', 'bypassPermissions', 'plan']] = {
-            PermissionMode.DEFAULT: "default",
-            PermissionMode.ACCEPT_EDITS: "acceptEdits",
-            PermissionMode.BYPASS_PERMISSIONS: "bypassPermissions",
-            PermissionMode.PLAN: "plan",
-        }
-
         # Build system prompt
         system_prompt = self._build_system_prompt()
 
@@ -300,7 +338,10 @@ class AgentEngine:
         # Setting sources type
         setting_sources: list[Literal['user', 'project', 'local']] | None = None
         if self.settings.agent.setting_sources:
-            setting_sources = [s for s in self.settings.agent.setting_sources if s in ('user', 'project', 'local')]  # type: ignore
+            setting_sources = [  # type: ignore
+                s for s in self.settings.agent.setting_sources
+                if s in ('user', 'project', 'local')
+            ]
 
         # Create options object
         options = ClaudeAgentOptions(
@@ -309,7 +350,7 @@ class AgentEngine:
             max_turns=self.settings.agent.max_turns,
             max_thinking_tokens=self.settings.agent.max_thinking_tokens,
             max_budget_usd=self.settings.agent.max_budget_usd,
-            permission_mode=permission_map[self.settings.agent.permission_mode],
+            permission_mode=_PERMISSION_MODES[self.settings.agent.permission_mode],
             allowed_tools=self.settings.agent.allowed_tools or [],
             disallowed_tools=self.settings.agent.disallowed_tools or [],
             cwd=str(self.settings.agent.cwd) if self.settings.agent.cwd else None,
@@ -333,28 +374,18 @@ class AgentEngine:
         if self.logger:
             self.logger.log_message(message)
 
-        # Track raw message (convert to dict for storage if possible)
-        try:
-            if hasattr(message, '__dict__'):
-                result.raw_messages.append(vars(message))
-            else:
-                result.raw_messages.append(str(message))
-        except Exception:
-            result.raw_messages.append(str(message))
+        # Track raw message (its attribute dict for storage if it has one)
+        message_dict = getattr(message, '__dict__', None)
+        result.raw_messages.append(message_dict if message_dict is not None else str(message))
 
         # Callback
         if self.on_message:
             self.on_message(message)
 
         # Process by type
-        if isinstance(message, SDKSystemMessage):
-            self._process_system_message(message, result)
-        elif isinstance(message, SDKAssistantMessage):
-            self._process_assistant_message(message, result)
-        elif isinstance(message, SDKUserMessage):
-            self._process_user_message(message, result)
-        elif isinstance(message, SDKResultMessage):
-            self._process_result_message(message, result)
+        handler_name = _MESSAGE_HANDLERS.get(type(message))
+        if handler_name:
+            getattr(self, handler_name)(message, result)
 
     def _process_system_message(
         self,
@@ -398,31 +429,16 @@ class AgentEngine:
             usage = getattr(message, 'usage', None)
             if usage:
                 # Extract token counts from usage dict or object
-                if isinstance(usage, dict):
-                    input_tokens = usage.get('input_tokens', 0)
-                    output_tokens = usage.get('output_tokens', 0)
-                    cache_creation = usage.get('cache_creation_input_tokens', 0)
-                    cache_read = usage.get('cache_read_input_tokens', 0)
-                else:
-                    input_tokens = getattr(usage, 'input_tokens', 0)
-                    output_tokens = getattr(usage, 'output_tokens', 0)
-                    cache_creation = getattr(usage, 'cache_creation_input_tokens', 0)
-                    cache_read = getattr(usage, 'cache_read_input_tokens', 0)
-
-                step_usage = TokenUsage(
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    cache_creation_tokens=cache_creation,
-                    cache_read_tokens=cache_read,
-                )
+                get = usage.get if isinstance(usage, dict) else partial(getattr, usage)
+                step_usage = TokenUsage(**{field: get(key, 0) or 0 for key, field in _USAGE_FIELDS})
                 result.total_usage.add(step_usage)
 
                 if self.logger:
                     self.logger.log_token_usage(
-                        input_tokens=input_tokens,
-                        output_tokens=output_tokens,
-                        cache_creation=cache_creation,
-                        cache_read=cache_read,
+                        input_tokens=step_usage.input_tokens,
+                        output_tokens=step_usage.output_tokens,
+                        cache_creation=step_usage.cache_creation_tokens,
+                        cache_read=step_usage.cache_read_tokens,
                     )
 
         # Process content blocks
@@ -456,16 +472,13 @@ class AgentEngine:
 
     def _block_to_dict(self, block: Any) -> dict[str, Any]:
         """Convert a content block to a dictionary."""
-        if isinstance(block, TextBlock):
-            return {"type": "text", "text": block.text}
-        elif isinstance(block, ToolUseBlock):
-            return {"type": "tool_use", "name": block.name, "input": block.input, "id": block.id}
-        elif isinstance(block, ToolResultBlock):
-            return {"type": "tool_result", "tool_use_id": block.tool_use_id, "content": block.content}
-        elif hasattr(block, '__dict__'):
-            return vars(block)
-        else:
-            return {"type": "unknown", "value": str(block)}
+        converter = _BLOCK_CONVERTERS.get(type(block))
+        if converter:
+            return converter(block)
+        block_dict = getattr(block, '__dict__', None)
+        if block_dict is not None:
+            return block_dict
+        return {"type": "unknown", "value": str(block)}
 
     def _process_user_message(
         self,
@@ -479,7 +492,9 @@ class AgentEngine:
         if isinstance(content, str):
             content_list = [{"type": "text", "text": content}]
         elif isinstance(content, list):
-            content_list = [self._block_to_dict(b) if not isinstance(b, dict) else b for b in content]
+            content_list = [
+                b if isinstance(b, dict) else self._block_to_dict(b) for b in content
+            ]
         else:
             content_list = [{"type": "text", "text": str(content)}]
 
@@ -503,13 +518,7 @@ class AgentEngine:
         result.session_id = message.session_id
 
         # Map subtype to status
-        status_map = {
-            "success": AgentStatus.SUCCESS,
-            "error_max_turns": AgentStatus.MAX_TURNS_REACHED,
-            "error_during_execution": AgentStatus.ERROR,
-            "error_max_structured_output_retries": AgentStatus.ERROR,
-        }
-        result.status = status_map.get(subtype, AgentStatus.ERROR)
+        result.status = _RESULT_STATUSES.get(subtype, AgentStatus.ERROR)
 
         if result.status == AgentStatus.ERROR:
             result.error = f"Execution ended with: {subtype}"
@@ -534,6 +543,7 @@ class AgentEngine:
         )
 
         self._processed_message_ids.clear()
+        started = time.perf_counter()
 
         try:
             options = self._build_options()
@@ -556,6 +566,9 @@ class AgentEngine:
                 self.logger.log_error(f"Agent execution failed: {e}")
 
         result.end_time = datetime.now()
+        if not result.duration_ms:
+            # No result message from the SDK; fall back to local timing
+            result.duration_ms = (time.perf_counter() - started) * 1000
         if result.status == AgentStatus.RUNNING:
             result.status = AgentStatus.SUCCESS
 
@@ -587,6 +600,7 @@ class AgentEngine:
         )
 
         self._processed_message_ids.clear()
+        started = time.perf_counter()
 
         try:
             options = self._build_options()
@@ -603,5 +617,7 @@ class AgentEngine:
 
         finally:
             result.end_time = datetime.now()
+            if not result.duration_ms:
+                result.duration_ms = (time.perf_counter() - started) * 1000
             if result.status == AgentStatus.RUNNING:
                 result.status = AgentStatus.SUCCESS
@@ -20,7 +20,7 @@ class AgentStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage tracking."""
     input_tokens: int = 0
@@ -40,7 +40,7 @@ class TokenUsage:
         self.cache_read_tokens += other.cache_read_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Record of a tool call."""
     tool_name: str
@@ -52,7 +52,7 @@ class ToolCall:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoItem:
     """Todo item from agent execution."""
     content: str
@@ -60,7 +60,7 @@ class TodoItem:
     active_form: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     """A single message in the agent conversation."""
     role: str  # user, assistant, system
@@ -70,7 +70,7 @@ class AgentMessage:
     usage: TokenUsage | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     """Complete result of an agent execution."""
     # Core result
@@ -195,3 +195,58 @@ class AgentResult:
             "error": self.error,
             "error_type": self.error_type,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AgentResult:
+        """Rebuild a result from the output of ``to_dict``."""
+        usage = data.get("total_usage") or {}
+        end_time = data.get("end_time")
+
+        return cls(
+            status=AgentStatus(data["status"]),
+            result_text=data.get("result_text"),
+            structured_output=data.get("structured_output"),
+            session_id=data.get("session_id"),
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=datetime.fromisoformat(end_time) if end_time else None,
+            duration_ms=data.get("duration_ms", 0.0),
+            total_usage=TokenUsage(
+                input_tokens=usage.get("input_tokens", 0),
+                output_tokens=usage.get("output_tokens", 0),
+                cache_creation_tokens=usage.get("cache_creation_tokens", 0),
+                cache_read_tokens=usage.get("cache_read_tokens", 0),
+            ),
+            total_cost_usd=data.get("total_cost_usd", 0.0),
+            num_turns=data.get("num_turns", 0),
+            messages=[
+                AgentMessage(
+                    role=m["role"],
+                    content=m["content"],
+                    timestamp=datetime.fromisoformat(m["timestamp"]),
+                    message_id=m.get("message_id"),
+                )
+                for m in data.get("messages", [])
+            ],
+            tool_calls=[
+                ToolCall(
+                    tool_name=tc["tool_name"],
+                    tool_input=tc["tool_input"],
+                    tool_output=tc.get("tool_output"),
+                    timestamp=datetime.fromisoformat(tc["timestamp"]),
+                    duration_ms=tc.get("duration_ms"),
+                    success=tc.get("success", True),
+                    error=tc.get("error"),
+                )
+                for tc in data.get("tool_calls", [])
+            ],
+            todos=[
+                TodoItem(
+                    content=t["content"],
+                    status=t["status"],
+                    active_form=t["active_form"],
+                )
+                for t in data.get("todos", [])
+            ],
+            error=data.get("error"),
+            error_type=data.get("error_type"),
+        )
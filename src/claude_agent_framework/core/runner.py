@@ -15,7 +15,9 @@ import platform
 import signal
 from collections.abc import Callable
 from datetime import datetime
+from pathlib import Path
 
+import orjson
 from rich.console import Console
 
 from claude_agent_framework.config.settings import Settings
@@ -24,6 +26,32 @@ from claude_agent_framework.core.result import AgentResult, AgentStatus, TodoIte
 from claude_agent_framework.notifications.slack import SlackNotifier
 from claude_agent_framework.tracking.cost_tracker import CostTracker
 from claude_agent_framework.tracking.logger import AgentLogger
+from claude_agent_framework.tracking.response_cache import ResponseCache
+
+# Settings that shape what a run can see and do, hashed into the response
+# cache key alongside the prompt and working directory
+_CACHE_KEY_FIELDS = {
+    "agent": {
+        "model",
+        "system_prompt_type",
+        "system_prompt_preset",
+        "system_prompt_content",
+        "max_turns",
+        "max_thinking_tokens",
+        "permission_mode",
+        "allowed_tools",
+        "disallowed_tools",
+        "setting_sources",
+    },
+    "sub_agents": True,
+    "mcp_servers": True,
+}
+
+_TODO_STATUS_ICONS = {
+    "completed": "[green]✓[/green]",
+    "in_progress": "[yellow]⟳[/yellow]",
+    "pending": "[dim]○[/dim]",
+}
 
 
 class AgentRunner:
@@ -77,12 +105,20 @@ class AgentRunner:
         self.slack = SlackNotifier(settings.slack)
 
         # Initialize cost tracker
-        cost_storage = settings.logging.log_dir / "costs.json" if settings.logging.enabled else None
+        cost_storage = (
+            settings.logging.log_dir / "costs.jsonl" if settings.logging.enabled else None
+        )
         self.cost_tracker = CostTracker(
             storage_path=cost_storage,
             budget_limit_usd=settings.agent.max_budget_usd,
         )
 
+        # Initialize response cache (opt-in)
+        self.response_cache = ResponseCache(
+            storage_path=settings.logging.log_dir / "response_cache.jsonl",
+            ttl_seconds=settings.response_cache_ttl_seconds,
+        ) if settings.response_cache_ttl_seconds and settings.logging.enabled else None
+
         # Initialize engine
         self.engine = AgentEngine(
             settings=settings,
@@ -93,17 +129,31 @@ class AgentRunner:
         # Service mode state
         self._running = False
         self._shutdown_event = asyncio.Event()
+        self._pending_notifications: set[asyncio.Task[bool]] = set()
+
+    async def __aenter__(self) -> AgentRunner:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release network resources held by the runner."""
+        await self.drain_notifications()
+        await self.slack.aclose()
+
+    async def drain_notifications(self) -> None:
+        """Wait for background Slack notifications and send any batched ones."""
+        if self._pending_notifications:
+            await asyncio.gather(*self._pending_notifications, return_exceptions=True)
+        await self.slack.flush()
 
     def _on_todo_update(self, todos: list[TodoItem]) -> None:
         """Handle todo updates."""
         if self.console:
             self.console.print("[cyan]Todo Update:[/cyan]")
             for todo in todos:
-                status_icon = {
-                    "completed": "[green]✓[/green]",
-                    "in_progress": "[yellow]⟳[/yellow]",
-                    "pending": "[dim]○[/dim]",
-                }.get(todo.status, "○")
+                status_icon = _TODO_STATUS_ICONS.get(todo.status, "○")
                 self.console.print(f"  {status_icon} {todo.content}")
 
     async def run_once(
@@ -125,6 +175,23 @@ class AgentRunner:
         task_prompt = prompt or self.settings.get_task_prompt()
         if not task_prompt:
             raise ValueError("No task prompt provided")
+        short_desc = task_description or task_prompt[:100]
+
+        # Serve identical prompts from the response cache (fresh sessions only)
+        cache_key = None
+        resuming = self.settings.session_id or self.settings.continue_conversation
+        if self.response_cache and not resuming:
+            cache_key = self._response_cache_key(task_prompt)
+            cached = self.response_cache.get(cache_key)
+            if cached:
+                # Nothing was spent on this run; the original trace, cost entry
+                # and notification already belong to the run that produced it
+                cached.total_cost_usd = 0.0
+                if self.logger:
+                    self.logger.log_info("Using cached result for identical prompt")
+                    self.logger.display_result_summary(cached)
+                    self.logger.display_final_message(cached)
+                return cached
 
         # Check budget before running
         within_budget, budget_msg = self.cost_tracker.check_budget()
@@ -135,7 +202,7 @@ class AgentRunner:
                 status=AgentStatus.BUDGET_EXCEEDED,
                 error=budget_msg,
             )
-            await self._handle_result(result, task_description or task_prompt[:100])
+            await self._handle_result(result, short_desc)
             return result
 
         # Start logging session
@@ -151,11 +218,14 @@ class AgentRunner:
             self.cost_tracker.track_result(
                 result,
                 model=self.settings.agent.model.value,
-                task_description=task_description or task_prompt[:100],
+                task_description=short_desc,
             )
 
+            if self.response_cache and cache_key:
+                self.response_cache.put(cache_key, result)
+
             # Handle result
-            await self._handle_result(result, task_description or task_prompt[:100])
+            await self._handle_result(result, short_desc)
 
             return result
 
@@ -163,29 +233,48 @@ class AgentRunner:
             if self.logger:
                 self.logger.end_session()
 
+    def _response_cache_key(self, prompt: str) -> str:
+        """Build the response cache key for a prompt under the current settings."""
+        config = self.settings.model_dump(mode="json", include=_CACHE_KEY_FIELDS)
+        return ResponseCache.make_key(
+            prompt,
+            str(self.settings.agent.cwd or Path.cwd()),
+            orjson.dumps(config, option=orjson.OPT_SORT_KEYS).decode(),
+        )
+
     async def _handle_result(
         self,
         result: AgentResult,
         task_description: str,
     ) -> None:
         """Handle agent result - logging, notifications, callbacks."""
-        # Log result
+        # Log result; the trace files are written in a worker thread so the
+        # disk I/O doesn't block the event loop
         if self.logger:
-            self.logger.log_result(result)
+            await asyncio.to_thread(self._persist_result, self.logger, result)
             self.logger.display_result_summary(result)
             self.logger.display_final_message(result)
 
-            # Save full trace
-            self.logger.save_full_trace(result)
-
-        # Send Slack notification
-        if self.slack.enabled:
-            await self.slack.notify_result(result, task_description)
+        # Send Slack notification; in service/cron mode it goes out in the
+        # background so a slow webhook doesn't delay the schedule
+        if self.slack.should_notify(result):
+            if self._running:
+                task = asyncio.create_task(self.slack.notify_result(result, task_description))
+                self._pending_notifications.add(task)
+                task.add_done_callback(self._pending_notifications.discard)
+            else:
+                await self.slack.notify_result(result, task_description)
 
         # Call result callback
         if self.on_result:
             self.on_result(result)
 
+    @staticmethod
+    def _persist_result(logger: AgentLogger, result: AgentResult) -> None:
+        """Write the result to the log files and save its full trace."""
+        logger.log_result(result)
+        logger.save_full_trace(result)
+
     async def run_service(
         self,
         prompt: str | None = None,
@@ -203,18 +292,18 @@ class AgentRunner:
         self._running = True
         self._shutdown_event.clear()
 
-        # Setup signal handlers (not available on Windows)
-        if platform.system() != "Windows":
-            loop = asyncio.get_event_loop()
-            for sig in (signal.SIGTERM, signal.SIGINT):
-                loop.add_signal_handler(sig, self._handle_shutdown)
+        loop = asyncio.get_running_loop()
+        self._install_signal_handlers(loop)
 
         if self.logger:
             self.logger.log_info(f"Starting service mode (interval: {self.settings.service_interval_seconds}s)")
 
+        interval = self.settings.service_interval_seconds
+        next_tick = loop.time()
         run_count = 0
         while self._running:
             run_count += 1
+            next_tick += interval
 
             if self.logger:
                 self.logger.log_info(f"Service run #{run_count}")
@@ -230,11 +319,17 @@ class AgentRunner:
                 if self.logger:
                     self.logger.log_error(f"Run #{run_count} error: {e}")
 
+            # Runs start on a fixed schedule; if a run overran its slot,
+            # start the next one now instead of bursting to catch up
+            now = loop.time()
+            if next_tick < now:
+                next_tick = now
+
             # Wait for next interval or shutdown
             try:
                 await asyncio.wait_for(
                     self._shutdown_event.wait(),
-                    timeout=self.settings.service_interval_seconds,
+                    timeout=next_tick - now,
                 )
                 # Shutdown was requested
                 break
@@ -242,9 +337,26 @@ class AgentRunner:
                 # Normal timeout, continue to next run
                 pass
 
+        await self.drain_notifications()
+
         if self.logger:
             self.logger.log_info("Service stopped")
 
+    def _install_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Stop the service on SIGTERM/SIGINT where the loop supports it."""
+        # Not available on Windows
+        if platform.system() == "Windows":
+            return
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self._handle_shutdown)
+            except (NotImplementedError, RuntimeError):
+                # Unsupported loop, or not running in the main thread; the
+                # service can still be stopped through stop()
+                if self.logger:
+                    self.logger.log_warning("Signal handlers unavailable; use stop() to shut down")
+                return
+
     def _handle_shutdown(self) -> None:
         """Handle shutdown signal."""
         if self.logger:
@@ -275,11 +387,7 @@ class AgentRunner:
         self._running = True
         self._shutdown_event.clear()
 
-        # Setup signal handlers (not available on Windows)
-        if platform.system() != "Windows":
-            loop = asyncio.get_event_loop()
-            for sig in (signal.SIGTERM, signal.SIGINT):
-                loop.add_signal_handler(sig, self._handle_shutdown)
+        self._install_signal_handlers(asyncio.get_running_loop())
 
         cron = croniter(self.settings.cron_schedule)
 
@@ -320,6 +428,8 @@ class AgentRunner:
                 if self.logger:
                     self.logger.log_error(f"Run #{run_count} error: {e}")
 
+        await self.drain_notifications()
+
         if self.logger:
             self.logger.log_info("Cron service stopped")
 
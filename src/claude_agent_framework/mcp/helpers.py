@@ -95,10 +95,12 @@ MEMORY_SERVER = create_stdio_server_config(
 )
 
 
+_COMMON_SERVERS = {
+    "filesystem": FILESYSTEM_SERVER,
+    "memory": MEMORY_SERVER,
+}
+
+
 def get_common_server(name: str) -> MCPServerConfig | None:
     """Get a pre-configured common MCP server."""
-    servers = {
-        "filesystem": FILESYSTEM_SERVER,
-        "memory": MEMORY_SERVER,
-    }
-    return servers.get(name)
+    return _COMMON_SERVERS.get(name)
@@ -6,15 +6,44 @@ Sends agent execution results to Slack via webhook.
 
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 
 if TYPE_CHECKING:
     from claude_agent_framework.config.settings import SlackConfig
     from claude_agent_framework.core.result import AgentResult
 
+_UTC = timezone.utc
+
+_ALERT_EMOJIS = {
+    "info": ":information_source:",
+    "warning": ":warning:",
+    "error": ":rotating_light:",
+}
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Truncate text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _timestamp_block(prefix: str) -> dict[str, Any]:
+    """Build the context block stamping a message with the current UTC time."""
+    return {
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": f"{prefix} {datetime.now(_UTC):%Y-%m-%d %H:%M:%S} UTC",
+            }
+        ],
+    }
+
 
 class SlackNotifier:
     """
@@ -37,6 +66,27 @@ class SlackNotifier:
         self.config = config
         self.enabled = config.enabled and config.webhook_url is not None
 
+        # Shared client so repeated notifications reuse pooled connections
+        self._client: httpx.AsyncClient | None = None
+
+        # Results waiting to be coalesced into one summary message
+        self._batch: list[tuple[AgentResult, str]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._in_flight: asyncio.Task[bool] | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Flush any batched results and close the shared HTTP client."""
+        await self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def send_message(
         self,
         text: str,
@@ -68,15 +118,15 @@ class SlackNotifier:
             payload["blocks"] = blocks
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.config.webhook_url,
-                    json=payload,
-                    timeout=30.0,
-                )
-                if response.status_code != 200:
-                    print(f"[Slack] Error: HTTP {response.status_code} - {response.text}")
-                return response.status_code == 200
+            response = await self._get_client().post(
+                self.config.webhook_url,
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=30.0,
+            )
+            if response.status_code != 200:
+                print(f"[Slack] Error: HTTP {response.status_code} - {response.text}")
+            return response.status_code == 200
         except Exception as e:
             print(f"[Slack] Exception: {e}")
             return False
@@ -108,7 +158,7 @@ class SlackNotifier:
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*Task:* {task_description[:200]}{'...' if len(task_description) > 200 else ''}",
+                    "text": f"*Task:* {_trunc(task_description, 200)}",
                 },
             })
 
@@ -138,9 +188,10 @@ class SlackNotifier:
 
         # Todos summary
         if result.todos:
-            completed = len([t for t in result.todos if t.status == "completed"])
-            pending = len([t for t in result.todos if t.status == "pending"])
-            in_progress = len([t for t in result.todos if t.status == "in_progress"])
+            counts = Counter(t.status for t in result.todos)
+            completed = counts["completed"]
+            pending = counts["pending"]
+            in_progress = counts["in_progress"]
 
             todo_text = f"*Todos:* {completed} completed, {in_progress} in progress, {pending} pending"
             blocks.append({
@@ -155,7 +206,7 @@ class SlackNotifier:
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f":warning: *Error:*\n```{result.error[:500]}```",
+                    "text": f":warning: *Error:*\n```{_trunc(result.error, 500)}```",
                 },
             })
 
@@ -163,7 +214,7 @@ class SlackNotifier:
         final_msg = result.get_final_message()
         if final_msg:
             # Truncate for Slack
-            preview = final_msg[:500] + ("..." if len(final_msg) > 500 else "")
+            preview = _trunc(final_msg, 500)
             blocks.append({"type": "divider"})
             blocks.append({
                 "type": "section",
@@ -174,18 +225,18 @@ class SlackNotifier:
             })
 
         # Timestamp
-        blocks.append({
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": f"Completed at {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                }
-            ],
-        })
+        blocks.append(_timestamp_block("Completed at"))
 
         return blocks
 
+    def should_notify(self, result: AgentResult) -> bool:
+        """Check whether a result should be notified based on the config."""
+        if not self.enabled:
+            return False
+        if result.is_success:
+            return self.config.notify_on_success
+        return self.config.notify_on_error
+
     async def notify_result(
         self,
         result: AgentResult,
@@ -201,15 +252,21 @@ class SlackNotifier:
         Returns:
             True if notification was sent successfully
         """
-        if not self.enabled:
+        if not self.should_notify(result):
             return False
 
-        # Check if we should notify based on result status
-        if result.is_success and not self.config.notify_on_success:
-            return False
-        if not result.is_success and not self.config.notify_on_error:
-            return False
+        if self.config.batch_window_seconds > 0:
+            self._batch.append((result, task_description))
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(
+                    self._flush_after(self.config.batch_window_seconds)
+                )
+            return True
 
+        return await self._send_result(result, task_description)
+
+    async def _send_result(self, result: AgentResult, task_description: str) -> bool:
+        """Send the full notification for a single result."""
         blocks = self._build_result_blocks(result, task_description)
         fallback_text = f"Agent {'completed successfully' if result.is_success else 'failed'}"
 
@@ -218,6 +275,111 @@ class SlackNotifier:
 
         return await self.send_message(fallback_text, blocks)
 
+    async def _flush_after(self, delay: float) -> None:
+        """Wait out the batch window, then send the buffered results."""
+        # Results that arrive while a send is in flight start another window
+        while self._batch:
+            await asyncio.sleep(delay)
+            # Shielded so that flush() cancelling the window can't abort a
+            # POST that is already under way
+            self._in_flight = asyncio.create_task(self._send_batch())
+            await asyncio.shield(self._in_flight)
+
+    async def flush(self) -> bool:
+        """
+        Send any batched results now instead of waiting for the window.
+
+        Returns:
+            True if a message was sent successfully
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        sent = False
+        if self._in_flight is not None and not self._in_flight.done():
+            sent = await self._in_flight
+        self._in_flight = None
+        return await self._send_batch() or sent
+
+    async def _send_batch(self) -> bool:
+        """Send the buffered results as one message."""
+        batch, self._batch = self._batch, []
+        if not batch:
+            return False
+        if len(batch) == 1:
+            return await self._send_result(*batch[0])
+
+        failed = sum(1 for result, _ in batch if not result.is_success)
+        fallback_text = f"{len(batch)} agent runs: {len(batch) - failed} succeeded, {failed} failed"
+        return await self.send_message(fallback_text, self._build_batch_blocks(batch))
+
+    def _build_batch_blocks(
+        self,
+        batch: list[tuple[AgentResult, str]],
+    ) -> list[dict[str, Any]]:
+        """Build Slack blocks summarizing several agent results."""
+        failed = sum(1 for result, _ in batch if not result.is_success)
+        status_emoji = ":x:" if failed else ":white_check_mark:"
+        status_text = f"{len(batch) - failed} succeeded, {failed} failed"
+
+        blocks: list[dict[str, Any]] = [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": f"{status_emoji} {len(batch)} Agent Runs: {status_text}",
+                    "emoji": True,
+                },
+            },
+        ]
+
+        # Aggregate metrics
+        metrics_text = []
+
+        if self.config.include_duration:
+            total_duration = sum(result.duration_seconds for result, _ in batch)
+            metrics_text.append(f"*Total Duration:* {total_duration:.2f}s")
+
+        if self.config.include_cost:
+            total_cost = sum(result.total_cost_usd for result, _ in batch)
+            metrics_text.append(f"*Total Cost:* ${total_cost:.4f}")
+
+        metrics_text.append(f"*Turns:* {sum(result.num_turns for result, _ in batch)}")
+
+        blocks.append({
+            "type": "section",
+            "fields": [
+                {"type": "mrkdwn", "text": text}
+                for text in metrics_text
+            ],
+        })
+
+        # One compact line per run
+        lines = []
+        for result, task_description in batch[:20]:
+            run_emoji = ":white_check_mark:" if result.is_success else ":x:"
+            line = f"{run_emoji} {_trunc(task_description, 80) or 'Agent run'}"
+            if self.config.include_cost:
+                line += f" - ${result.total_cost_usd:.4f}"
+            if self.config.include_duration:
+                line += f", {result.duration_seconds:.1f}s"
+            if not result.is_success:
+                line += f" ({result.error_type or 'Unknown'})"
+            lines.append(line)
+        if len(batch) > 20:
+            lines.append(f"...and {len(batch) - 20} more")
+
+        blocks.append({
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "\n".join(lines)},
+        })
+
+        # Timestamp
+        blocks.append(_timestamp_block("Completed at"))
+
+        return blocks
+
     async def send_simple_message(self, message: str) -> bool:
         """
         Send a simple text message to Slack.
@@ -247,12 +409,7 @@ class SlackNotifier:
         Returns:
             True if successful
         """
-        emoji_map = {
-            "info": ":information_source:",
-            "warning": ":warning:",
-            "error": ":rotating_light:",
-        }
-        emoji = emoji_map.get(level, ":bell:")
+        emoji = _ALERT_EMOJIS.get(level, ":bell:")
 
         blocks = [
             {
@@ -270,15 +427,7 @@ class SlackNotifier:
                     "text": message,
                 },
             },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"Alert at {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                    }
-                ],
-            },
+            _timestamp_block("Alert at"),
         ]
 
         return await self.send_message(f"{title}: {message}", blocks)
@@ -2,8 +2,10 @@
 
 from claude_agent_framework.tracking.cost_tracker import CostTracker
 from claude_agent_framework.tracking.logger import AgentLogger
+from claude_agent_framework.tracking.response_cache import ResponseCache
 
 __all__ = [
     "AgentLogger",
     "CostTracker",
+    "ResponseCache",
 ]
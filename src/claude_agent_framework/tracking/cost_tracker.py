@@ -9,12 +9,13 @@ Provides detailed cost tracking for agent executions including:
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from claude_agent_framework.core.result import AgentResult, TokenUsage
 
 # Pricing per million tokens (as of late 2024)
@@ -111,59 +112,78 @@ class CostTracker:
         self._load_history()
 
     def _load_history(self) -> None:
-        """Load cost history from storage."""
-        if self.storage_path and self.storage_path.exists():
-            try:
-                with open(self.storage_path) as f:
-                    data = json.load(f)
-
-                for entry_data in data.get("entries", []):
-                    entry = CostEntry(
-                        timestamp=datetime.fromisoformat(entry_data["timestamp"]),
-                        session_id=entry_data.get("session_id"),
-                        model=entry_data["model"],
-                        usage=TokenUsage(
-                            input_tokens=entry_data["usage"]["input_tokens"],
-                            output_tokens=entry_data["usage"]["output_tokens"],
-                            cache_creation_tokens=entry_data["usage"].get("cache_creation_tokens", 0),
-                            cache_read_tokens=entry_data["usage"].get("cache_read_tokens", 0),
-                        ),
-                        cost_usd=entry_data["cost_usd"],
-                        task_description=entry_data.get("task_description", ""),
-                    )
-                    self.summary.add_entry(entry)
-            except (json.JSONDecodeError, KeyError):
-                pass  # Start fresh if file is corrupted
-
-    def _save_history(self) -> None:
-        """Save cost history to storage."""
+        """Load cost history from storage (one JSON entry per line)."""
+        if not self.storage_path:
+            return
+
+        if not self.storage_path.exists():
+            self._migrate_legacy_history(self.storage_path)
+            return
+
+        with open(self.storage_path, "rb") as f:
+            for line in f:
+                try:
+                    self.summary.add_entry(self._entry_from_dict(orjson.loads(line)))
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    continue  # Skip partial or corrupted lines
+
+    def _migrate_legacy_history(self, storage_path: Path) -> None:
+        """Convert a legacy costs.json file next to the JSONL log, if present."""
+        legacy_path = storage_path.with_suffix(".json")
+        if legacy_path == storage_path or not legacy_path.exists():
+            return
+
+        try:
+            data = orjson.loads(legacy_path.read_bytes())
+            entries = [self._entry_from_dict(e) for e in data.get("entries", [])]
+        except (orjson.JSONDecodeError, KeyError, TypeError, AttributeError):
+            return  # Start fresh if file is corrupted
+
+        for entry in entries:
+            self.summary.add_entry(entry)
+            self._append_entry(entry)
+        legacy_path.rename(legacy_path.with_name(legacy_path.name + ".bak"))
+
+    @staticmethod
+    def _entry_from_dict(entry_data: dict[str, Any]) -> CostEntry:
+        """Build a cost entry from its stored form."""
+        return CostEntry(
+            timestamp=datetime.fromisoformat(entry_data["timestamp"]),
+            session_id=entry_data.get("session_id"),
+            model=entry_data["model"],
+            usage=TokenUsage(
+                input_tokens=entry_data["usage"]["input_tokens"],
+                output_tokens=entry_data["usage"]["output_tokens"],
+                cache_creation_tokens=entry_data["usage"].get("cache_creation_tokens", 0),
+                cache_read_tokens=entry_data["usage"].get("cache_read_tokens", 0),
+            ),
+            cost_usd=entry_data["cost_usd"],
+            task_description=entry_data.get("task_description", ""),
+        )
+
+    def _append_entry(self, entry: CostEntry) -> None:
+        """Append a single entry to storage."""
         if not self.storage_path:
             return
 
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
         data = {
-            "total_cost_usd": self.summary.total_cost_usd,
-            "entries": [
-                {
-                    "timestamp": entry.timestamp.isoformat(),
-                    "session_id": entry.session_id,
-                    "model": entry.model,
-                    "usage": {
-                        "input_tokens": entry.usage.input_tokens,
-                        "output_tokens": entry.usage.output_tokens,
-                        "cache_creation_tokens": entry.usage.cache_creation_tokens,
-                        "cache_read_tokens": entry.usage.cache_read_tokens,
-                    },
-                    "cost_usd": entry.cost_usd,
-                    "task_description": entry.task_description,
-                }
-                for entry in self.summary.entries
-            ],
+            "timestamp": entry.timestamp.isoformat(),
+            "session_id": entry.session_id,
+            "model": entry.model,
+            "usage": {
+                "input_tokens": entry.usage.input_tokens,
+                "output_tokens": entry.usage.output_tokens,
+                "cache_creation_tokens": entry.usage.cache_creation_tokens,
+                "cache_read_tokens": entry.usage.cache_read_tokens,
+            },
+            "cost_usd": entry.cost_usd,
+            "task_description": entry.task_description,
         }
 
-        with open(self.storage_path, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(self.storage_path, "ab") as f:
+            f.write(orjson.dumps(data) + b"\n")
 
     @staticmethod
     def calculate_cost(usage: TokenUsage, model: str = "sonnet") -> float:
@@ -220,7 +240,7 @@ class CostTracker:
         )
 
         self.summary.add_entry(entry)
-        self._save_history()
+        self._append_entry(entry)
 
         return entry
 
@@ -17,6 +17,7 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.panel import Panel
@@ -368,8 +369,8 @@ class AgentLogger:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = self.log_dir / f"trace_{result.session_id or timestamp}.json"
 
-        with open(output_path, "w") as f:
-            json.dump(result.to_dict(), f, indent=2, default=str)
+        trace = orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2, default=str)
+        output_path.write_bytes(trace)
 
         self.log_info(f"Full trace saved to: {output_path}")
         return output_path
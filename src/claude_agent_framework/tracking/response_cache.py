@@ -0,0 +1,124 @@
+"""
+Response cache for repeated agent prompts.
+
+Stores successful agent results in an append-only JSONL file keyed by a
+hash of the prompt and the settings that shape the response, so identical
+runs within the TTL can be answered without calling the API again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from claude_agent_framework.core.result import AgentResult
+
+
+class ResponseCache:
+    """
+    Exact-match cache of agent results.
+
+    Features:
+    - Keys derived from prompt + model + system prompt (blake2b)
+    - Time-to-live expiry
+    - Append-only JSONL storage (one line per cached result), compacted on load
+    """
+
+    def __init__(
+        self,
+        storage_path: Path | str,
+        ttl_seconds: int,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            storage_path: Path to the JSONL cache file
+            ttl_seconds: How long a cached result stays valid
+        """
+        self.storage_path = Path(storage_path)
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._load()
+
+    @staticmethod
+    def make_key(*parts: str | None) -> str:
+        """Build a cache key from the inputs that determine a response."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update((part or "").encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _load(self) -> None:
+        """Load unexpired entries from storage, compacting the file if needed."""
+        if not self.storage_path.exists():
+            return
+
+        cutoff = time.time() - self.ttl_seconds
+        num_lines = 0
+        with open(self.storage_path, "rb") as f:
+            for line in f:
+                num_lines += 1
+                try:
+                    record = orjson.loads(line)
+                    if record["timestamp"] >= cutoff:
+                        self._entries[record["key"]] = (record["timestamp"], record["result"])
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    continue  # Skip partial or corrupted lines
+
+        # Drop expired, superseded and corrupted lines so the file stays
+        # bounded by the number of live entries
+        if num_lines > len(self._entries):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite storage with only the in-memory entries."""
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            for key, (timestamp, data) in self._entries.items():
+                f.write(self._encode(key, timestamp, data))
+        tmp_path.replace(self.storage_path)
+
+    @staticmethod
+    def _encode(key: str, timestamp: float, data: dict[str, Any]) -> bytes:
+        """Encode one cache record as a JSONL line."""
+        record = {"key": key, "timestamp": timestamp, "result": data}
+        return orjson.dumps(record, default=str) + b"\n"
+
+    def get(self, key: str) -> AgentResult | None:
+        """Return the cached result for a key, or None on miss/expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        timestamp, data = entry
+        if time.time() - timestamp > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        return AgentResult.from_dict(data)
+
+    def put(self, key: str, result: AgentResult) -> None:
+        """Cache a successful result."""
+        if not result.is_success:
+            return
+
+        timestamp = time.time()
+        data = result.to_dict()
+        self._entries[key] = (timestamp, data)
+
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.storage_path, "ab") as f:
+            f.write(self._encode(key, timestamp, data))
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        if self.storage_path.exists():
+            self.storage_path.unlink()
@@ -5,6 +5,8 @@ from claude_agent_framework.utils.helpers import (
     format_duration,
     safe_json_dumps,
     truncate_text,
+    yaml_dump,
+    yaml_load,
 )
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     "format_duration",
     "format_cost",
     "safe_json_dumps",
+    "yaml_load",
+    "yaml_dump",
 ]
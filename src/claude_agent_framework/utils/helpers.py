@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from datetime import datetime
 from pathlib import Path
@@ -47,6 +48,8 @@ def safe_json_dumps(obj: Any, **kwargs: Any) -> str:
             return str(o)
         if hasattr(o, "to_dict"):
             return o.to_dict()
+        if dataclasses.is_dataclass(o) and not isinstance(o, type):
+            return dataclasses.asdict(o)
         if hasattr(o, "__dict__"):
             return o.__dict__
         return str(o)
@@ -54,6 +57,20 @@ def safe_json_dumps(obj: Any, **kwargs: Any) -> str:
     return json.dumps(obj, default=default_serializer, **kwargs)
 
 
+def yaml_load(stream: Any) -> Any:
+    """Safe-load YAML, using the LibYAML C loader when available."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def yaml_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """Safe-dump YAML, using the LibYAML C dumper when available."""
+    import yaml
+
+    return yaml.dump(data, stream, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), **kwargs)
+
+
 def ensure_dir(path: Path) -> Path:
     """Ensure a directory exists."""
     path.mkdir(parents=True, exist_ok=True)
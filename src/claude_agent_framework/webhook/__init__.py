@@ -4,12 +4,29 @@ Webhook module for Claude Agent Framework.
 Provides webhook endpoints to trigger agents from external events.
 """
 
-from claude_agent_framework.webhook.models import (
-    LinearWebhookPayload,
-    RouteCondition,
-    WebhookRouteRule,
-)
-from claude_agent_framework.webhook.server import WebhookServer
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from claude_agent_framework._lazy import attach
+
+if TYPE_CHECKING:
+    from claude_agent_framework.webhook.models import (
+        LinearWebhookPayload,
+        RouteCondition,
+        WebhookRouteRule,
+    )
+    from claude_agent_framework.webhook.server import WebhookServer
+
+# Resolved on first access (PEP 562) so that importing the models or
+# handlers (e.g. for ``caf webhook --generate-routes``) doesn't pull in
+# FastAPI and uvicorn through the server module.
+_LAZY_IMPORTS = {
+    "WebhookServer": "claude_agent_framework.webhook.server",
+    "LinearWebhookPayload": "claude_agent_framework.webhook.models",
+    "RouteCondition": "claude_agent_framework.webhook.models",
+    "WebhookRouteRule": "claude_agent_framework.webhook.models",
+}
 
 __all__ = [
     "WebhookServer",
@@ -17,3 +34,6 @@ __all__ = [
     "RouteCondition",
     "WebhookRouteRule",
 ]
+
+
+__getattr__, __dir__ = attach(__name__, _LAZY_IMPORTS)
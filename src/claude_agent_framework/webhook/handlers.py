@@ -13,7 +13,6 @@ from claude_agent_framework.webhook.models import (
     LinearWebhookPayload,
     WebhookRouteRule,
 )
-from claude_agent_framework.notifications.slack import SlackNotifier
 
 if TYPE_CHECKING:
     from claude_agent_framework.config.settings import Settings
@@ -54,9 +53,10 @@ class WebhookHandler:
             return
 
         try:
-            import yaml
+            from claude_agent_framework.utils.helpers import yaml_load
+
             with open(routes_file) as f:
-                routes_data = yaml.safe_load(f)
+                routes_data = yaml_load(f)
 
             if isinstance(routes_data, list):
                 self.route_rules = [WebhookRouteRule(**rule) for rule in routes_data]
@@ -149,29 +149,24 @@ class WebhookHandler:
             # Import here to avoid circular dependencies
             from claude_agent_framework.core.runner import AgentRunner
 
-            # Create a new runner instance
-            runner = AgentRunner(self.settings)
-
-            # Run the agent
-            result = await runner.run_once(prompt)
+            # Create a new runner instance; its notifier (and pooled HTTP
+            # client) sends the Slack notification for this run
+            async with AgentRunner(self.settings) as runner:
+                # Run the agent
+                result = await runner.run_once(prompt, task_description=f"Webhook: {event_key}")
 
             # Log the result
             if result.status.value == "success":
                 logger.info(
                     f"Agent completed successfully for {event_key}: "
                     f"{result.total_usage.total_tokens if result.total_usage else 'N/A'} tokens, "
-                    f"${result.cost_usd:.4f}"
+                    f"${result.total_cost_usd:.4f}"
                 )
             else:
                 logger.error(
-                    f"Agent failed for {event_key}: {result.error_message}"
+                    f"Agent failed for {event_key}: {result.error}"
                 )
 
-            # Send Slack notification
-            slack = SlackNotifier(self.settings.slack)
-            if slack.enabled:
-                await slack.notify_result(result, f"Webhook: {event_key}")
-
         except Exception as e:
             logger.error(f"Error running agent for {event_key}: {e}", exc_info=True)
 
@@ -182,13 +177,13 @@ class WebhookHandler:
         Args:
             file_path: Path to save the routes file
         """
-        import yaml
+        from claude_agent_framework.utils.helpers import yaml_dump
 
-        routes_data = [rule.model_dump() for rule in self.route_rules]
+        routes_data = [rule.model_dump(mode="json") for rule in self.route_rules]
 
         file_path.parent.mkdir(parents=True, exist_ok=True)
         with open(file_path, "w") as f:
-            yaml.dump(routes_data, f, default_flow_style=False, sort_keys=False)
+            yaml_dump(routes_data, f, default_flow_style=False, sort_keys=False)
 
         logger.info(f"Saved {len(self.route_rules)} webhook routes to {file_path}")
 
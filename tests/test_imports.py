@@ -0,0 +1,94 @@
+"""Cold-import smoke tests.
+
+Each import runs in a fresh interpreter so that circular imports between
+subpackages can't be masked by modules another test already loaded.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+MODULES = [
+    "claude_agent_framework",
+    "claude_agent_framework.cli",
+    "claude_agent_framework.agents",
+    "claude_agent_framework.config",
+    "claude_agent_framework.core",
+    "claude_agent_framework.core.result",
+    "claude_agent_framework.core.engine",
+    "claude_agent_framework.core.runner",
+    "claude_agent_framework.mcp",
+    "claude_agent_framework.notifications",
+    "claude_agent_framework.tracking",
+    "claude_agent_framework.tracking.cost_tracker",
+    "claude_agent_framework.tracking.logger",
+    "claude_agent_framework.tracking.response_cache",
+    "claude_agent_framework.utils",
+    "claude_agent_framework.webhook",
+    "claude_agent_framework.webhook.handlers",
+]
+
+
+def _run(code: str, cwd: str | None = None) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+
+
+def _loaded_modules(module: str) -> set[str]:
+    """Return the names in sys.modules after a cold import of module."""
+    proc = _run(f"import sys, {module}; print('\\n'.join(sys.modules))")
+    assert proc.returncode == 0, proc.stderr
+    return set(proc.stdout.split())
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_cold_import(module: str) -> None:
+    proc = _run(f"import {module}")
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_costs_command(tmp_path) -> None:
+    proc = _run(
+        "from claude_agent_framework.cli import app; app(['costs'])",
+        cwd=str(tmp_path),
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "Cost Report" in proc.stdout
+
+
+@pytest.mark.parametrize(
+    "heavy",
+    [
+        "claude_agent_sdk",
+        "pydantic",
+        "claude_agent_framework.core.runner",
+        "claude_agent_framework.tracking",
+    ],
+)
+def test_package_import_is_light(heavy: str) -> None:
+    assert heavy not in _loaded_modules("claude_agent_framework")
+
+
+@pytest.mark.parametrize(
+    "heavy",
+    [
+        "claude_agent_framework.tui",
+        "claude_agent_framework.webhook.server",
+        "fastapi",
+        "textual",
+    ],
+)
+def test_cli_import_is_light(heavy: str) -> None:
+    assert heavy not in _loaded_modules("claude_agent_framework.cli")
+
+
+@pytest.mark.parametrize("heavy", ["fastapi", "uvicorn"])
+def test_webhook_handlers_skip_server(heavy: str) -> None:
+    assert heavy not in _loaded_modules("claude_agent_framework.webhook.handlers")